@@ -0,0 +1,9 @@
+"""Tests for the Blog App"""
+from ..models import Post
+
+
+def reload_with_m2m(post):
+    """Fetch post again with its m2m relations prefetched"""
+    return Post.objects.prefetch_related(
+        "tags", "startups"
+    ).get(pk=post.pk)
@@ -2,13 +2,13 @@
 from random import randint
 
 from factory import (
-    DjangoModelFactory,
     Faker,
     Sequence,
     post_generation,
 )
 
 from organizer.tests.factories import (
+    BulkModelFactory,
     StartupFactory,
     TagFactory,
 )
@@ -16,7 +16,7 @@ from organizer.tests.factories import (
 from ..models import Post
 
 
-class PostFactory(DjangoModelFactory):
+class PostFactory(BulkModelFactory):
     """Factory for Blog Post data"""
 
     title = Faker(
@@ -1,8 +1,10 @@
 """Tests for Blog Views"""
-import json
+from datetime import date
 from functools import partial
-from random import randint
+from random import randint, sample
+from uuid import uuid4
 
+import pytest
 from test_plus import APITestCase
 
 from config.test_utils import (
@@ -14,6 +16,7 @@ from config.test_utils import (
 
 from ..models import Post
 from ..serializers import PostSerializer
+from . import reload_with_m2m
 from .factories import (
     PostFactory,
     StartupFactory,
@@ -22,19 +25,73 @@ from .factories import (
 
 remove_m2m = partial(omit_keys, "tags", "startups")
 
+# built once: tests need a valid payload, not an instance
+_POST_TEMPLATE = remove_m2m(
+    get_instance_data(PostFactory.build())
+)
+
+
+def new_post_data():
+    """Return POST data for a Post not in the database"""
+    return _POST_TEMPLATE | {
+        "slug": f"post-{uuid4().hex[:8]}",
+        "pub_date": date.today().isoformat(),
+    }
+
 
 class PostAPITests(APITestCase):
     """Test API views for Post objects"""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Generate tags and startups shared by the suite"""
+        cls.shared_tags = TagFactory.create_batch_bulk(10)
+        cls.shared_startups = (
+            StartupFactory.create_batch_bulk(10)
+        )
+        cls.shared_tag_urls = {
+            tag.pk: reverse("api-tag-detail", slug=tag.slug)
+            for tag in cls.shared_tags
+        }
+        cls.shared_startup_urls = {
+            startup.pk: reverse(
+                "api-startup-detail", slug=startup.slug
+            )
+            for startup in cls.shared_startups
+        }
+
+    @staticmethod
+    def sample_related(obj_list, url_map):
+        """Pick shared objects and their URLs at random"""
+        picked = sample(obj_list, k=randint(1, 10))
+        return picked, [url_map[obj.pk] for obj in picked]
+
     @property
     def response_json(self):
         """Shortcut to obtain JSON from last response"""
-        return json.loads(self.last_response.content)
+        return self.last_response.json()
 
     def test_list(self):
         """Is there a list of Post objects"""
         url_name = "api-post-list"
-        post_list = PostFactory.create_batch(10)
+        post_list = PostFactory.create_batch_bulk(10)
+        # as many relations as PostFactory would add
+        Post.tags.through.objects.bulk_create(
+            Post.tags.through(post=post, tag=tag)
+            for post in post_list
+            for tag in sample(
+                self.shared_tags, k=randint(0, 5)
+            )
+        )
+        Post.startups.through.objects.bulk_create(
+            Post.startups.through(
+                post=post, startup=startup
+            )
+            for post in post_list
+            for startup in sample(
+                self.shared_startups, k=randint(0, 2)
+            )
+        )
         self.get_check_200(url_name)
         self.assertCountEqual(
             self.response_json,
@@ -51,48 +108,40 @@ class PostAPITests(APITestCase):
 
     def test_list_create(self):
         """Can we create Posts via the POST to list view?"""
-        count = Post.objects.count()
-        self.post(
-            "api-post-list",
-            data=remove_m2m(
-                get_instance_data(PostFactory.build())
-            ),
-        )
+        self.post("api-post-list", data=new_post_data())
         self.response_201()
-        self.assertEqual(count + 1, Post.objects.count())
+        new_slug = self.response_json["slug"]
+        self.assertTrue(
+            Post.objects.filter(slug=new_slug).exists()
+        )
 
     def test_list_create_m2m(self):
         """Can new Posts be related with tags & startups?"""
-        count = Post.objects.count()
-        tag_list = TagFactory.create_batch(randint(1, 10))
-        tag_urls = [
-            reverse("api-tag-detail", slug=tag.slug)
-            for tag in tag_list
-        ]
-        startup_list = StartupFactory.create_batch(
-            randint(1, 10)
-        )
-        startup_urls = [
-            reverse("api-startup-detail", slug=startup.slug)
-            for startup in startup_list
-        ]
-        post = PostFactory.build()
+        tag_list, tag_urls = self.sample_related(
+            self.shared_tags, self.shared_tag_urls
+        )
+        startup_list, startup_urls = self.sample_related(
+            self.shared_startups, self.shared_startup_urls
+        )
+        post_data = new_post_data()
         self.post(
             "api-post-list",
-            data=dict(
-                remove_m2m(get_instance_data(post)),
-                tags=tag_urls,
-                startups=startup_urls,
-            ),
+            data=post_data
+            | {"tags": tag_urls, "startups": startup_urls},
         )
         self.response_201()
-        self.assertEqual(count + 1, Post.objects.count())
+        # raises DoesNotExist if the Post was not created
         post = Post.objects.get(
-            slug=post.slug, pub_date=post.pub_date
+            slug=post_data["slug"],
+            pub_date=post_data["pub_date"],
         )
-        self.assertCountEqual(tag_list, post.tags.all())
-        self.assertCountEqual(
-            startup_list, post.startups.all()
+        self.assertEqual(
+            {tag.pk for tag in tag_list},
+            set(post.tags.values_list("pk", flat=True)),
+        )
+        self.assertEqual(
+            {startup.pk for startup in startup_list},
+            set(post.startups.values_list("pk", flat=True)),
         )
 
     def test_detail(self):
@@ -110,62 +159,40 @@ class PostAPITests(APITestCase):
             PostSerializer(post, **context_kwarg(url)).data,
         )
 
-    def test_detail_404(self):
-        """Do we generate 404 if post not found?"""
-        self.get(
-            "api-post-detail",
-            year=2018,
-            month=8,
-            slug="now-recording",
-        )
-        self.response_404()
-
     def test_detail_update(self):
         """Can we update a Post via PUT?"""
         post = PostFactory(title="first")
         count = Post.objects.count()
-        tag_list = TagFactory.create_batch(randint(1, 10))
-        tag_urls = [
-            reverse("api-tag-detail", slug=tag.slug)
-            for tag in tag_list
-        ]
-        startup_list = StartupFactory.create_batch(
-            randint(1, 10)
-        )
-        startup_urls = [
-            reverse("api-startup-detail", slug=startup.slug)
-            for startup in startup_list
-        ]
+        tag_list, tag_urls = self.sample_related(
+            self.shared_tags, self.shared_tag_urls
+        )
+        startup_list, startup_urls = self.sample_related(
+            self.shared_startups, self.shared_startup_urls
+        )
         self.put(
             "api-post-detail",
             year=post.pub_date.year,
             month=post.pub_date.month,
             slug=post.slug,
-            data=dict(
-                remove_m2m(get_instance_data(post)),
-                title="second",
-                tags=tag_urls,
-                startups=startup_urls,
-            ),
+            data=remove_m2m(get_instance_data(post))
+            | {
+                "title": "second",
+                "tags": tag_urls,
+                "startups": startup_urls,
+            },
         )
         self.response_200()
         self.assertEqual(count, Post.objects.count())
-        post.refresh_from_db()
+        post = reload_with_m2m(post)
         self.assertEqual("second", post.title)
-        self.assertCountEqual(tag_list, post.tags.all())
-        self.assertCountEqual(
-            startup_list, post.startups.all()
+        self.assertEqual(
+            {tag.pk for tag in tag_list},
+            {tag.pk for tag in post.tags.all()},
         )
-
-    def test_detail_update_404(self):
-        """Do we generate 404 if post not found?"""
-        self.put(
-            "api-post-detail",
-            year=2018,
-            month=11,
-            slug="post-recording",
+        self.assertEqual(
+            {startup.pk for startup in startup_list},
+            {startup.pk for startup in post.startups.all()},
         )
-        self.response_404()
 
     def test_detail_partial_update(self):
         """Can we update a Post via PATCH?
@@ -176,25 +203,29 @@ class PostAPITests(APITestCase):
         actions.
         """
         post = PostFactory(
-            title="first",
-            tags=TagFactory.create_batch(randint(1, 10)),
-            startups=StartupFactory.create_batch(
+            title="first", tags=[], startups=[]
+        )
+        Post.tags.through.objects.bulk_create(
+            Post.tags.through(post=post, tag=tag)
+            for tag in TagFactory.create_batch_bulk(
                 randint(1, 10)
-            ),
+            )
+        )
+        Post.startups.through.objects.bulk_create(
+            Post.startups.through(
+                post=post, startup=startup
+            )
+            for startup in StartupFactory.create_batch_bulk(
+                randint(1, 10)
+            )
         )
         count = Post.objects.count()
-        tag_list = TagFactory.create_batch(randint(1, 10))
-        tag_urls = [
-            reverse("api-tag-detail", slug=tag.slug)
-            for tag in tag_list
-        ]
-        startup_list = StartupFactory.create_batch(
-            randint(1, 10)
-        )
-        startup_urls = [
-            reverse("api-startup-detail", slug=startup.slug)
-            for startup in startup_list
-        ]
+        tag_list, tag_urls = self.sample_related(
+            self.shared_tags, self.shared_tag_urls
+        )
+        startup_list, startup_urls = self.sample_related(
+            self.shared_startups, self.shared_startup_urls
+        )
         self.patch(
             "api-post-detail",
             year=post.pub_date.year,
@@ -213,22 +244,16 @@ class PostAPITests(APITestCase):
         )
         self.response_200()
         self.assertEqual(count, Post.objects.count())
-        post.refresh_from_db()
+        post = reload_with_m2m(post)
         self.assertEqual("second", post.title)
-        self.assertCountEqual(tag_list, post.tags.all())
-        self.assertCountEqual(
-            startup_list, post.startups.all()
+        self.assertEqual(
+            {tag.pk for tag in tag_list},
+            {tag.pk for tag in post.tags.all()},
         )
-
-    def test_detail_partial_update_404(self):
-        """Do we generate 404 if post not found?"""
-        self.patch(
-            "api-post-detail",
-            year=2018,
-            month=11,
-            slug="post-recording",
+        self.assertEqual(
+            {startup.pk for startup in startup_list},
+            {startup.pk for startup in post.startups.all()},
         )
-        self.response_404()
 
     def test_detail_delete(self):
         """Can we delete a post?"""
@@ -244,12 +269,37 @@ class PostAPITests(APITestCase):
             Post.objects.filter(pk=post.pk).exists()
         )
 
-    def test_detail_delete_404(self):
-        """Do we generate 404 if post not found?"""
-        self.delete(
-            "api-post-detail",
-            year=2018,
-            month=11,
-            slug="nonexistent",
-        )
-        self.response_404()
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "method, url_kwargs",
+    [
+        (
+            "get",
+            dict(year=2018, month=8, slug="now-recording"),
+        ),
+        (
+            "put",
+            dict(
+                year=2018, month=11, slug="post-recording"
+            ),
+        ),
+        (
+            "patch",
+            dict(
+                year=2018, month=11, slug="post-recording"
+            ),
+        ),
+        (
+            "delete",
+            dict(year=2018, month=11, slug="nonexistent"),
+        ),
+    ],
+)
+def test_detail_404(client, method, url_kwargs):
+    """Do we generate 404 if post not found?"""
+    request = getattr(client, method)
+    response = request(
+        reverse("api-post-detail", **url_kwargs)
+    )
+    assert response.status_code == 404
@@ -9,6 +9,7 @@ from config.test_utils import (
     get_instance_data,
     omit_keys,
     reverse,
+    reverse_many,
 )
 from organizer.tests.factories import (
     StartupFactory,
@@ -53,41 +54,29 @@ class PostSerializerTests(TestCase):
         )
         self.assertCountEqual(
             s_post.data["tags"],
-            [
-                reverse(
-                    "api-tag-detail",
-                    slug=tag.slug,
-                    full=True,
-                )
-                for tag in tag_list
-            ],
+            reverse_many(
+                "api-tag-detail", tag_list, full=True
+            ),
         )
         self.assertCountEqual(
             s_post.data["startups"],
-            [
-                reverse(
-                    "api-startup-detail",
-                    slug=startup.slug,
-                    full=True,
-                )
-                for startup in startup_list
-            ],
+            reverse_many(
+                "api-startup-detail",
+                startup_list,
+                full=True,
+            ),
         )
 
     def test_deserialization(self):
         """Can we deserialize data to a Post model?"""
         tag_list = TagFactory.create_batch(randint(1, 10))
-        tag_urls = [
-            reverse("api-tag-detail", slug=tag.slug)
-            for tag in tag_list
-        ]
+        tag_urls = reverse_many("api-tag-detail", tag_list)
         startup_list = StartupFactory.create_batch(
             randint(1, 10)
         )
-        startup_urls = [
-            reverse("api-startup-detail", slug=startup.slug)
-            for startup in startup_list
-        ]
+        startup_urls = reverse_many(
+            "api-startup-detail", startup_list
+        )
         post_data = remove_m2m(
             get_instance_data(PostFactory.build())
         )
@@ -114,17 +103,13 @@ class PostSerializerTests(TestCase):
     def test_deserialization_update(self):
         """Can we deserialize to an existing Post model?"""
         tag_list = TagFactory.create_batch(randint(1, 10))
-        tag_urls = [
-            reverse("api-tag-detail", slug=tag.slug)
-            for tag in tag_list
-        ]
+        tag_urls = reverse_many("api-tag-detail", tag_list)
         startup_list = StartupFactory.create_batch(
             randint(1, 10)
         )
-        startup_urls = [
-            reverse("api-startup-detail", slug=startup.slug)
-            for startup in startup_list
-        ]
+        startup_urls = reverse_many(
+            "api-startup-detail", startup_list
+        )
         post = PostFactory(
             title="first", tags=TagFactory.create_batch(3)
         )
@@ -161,17 +146,13 @@ class PostSerializerTests(TestCase):
     def test_deserialization_partial_update(self):
         """Can we partially deserialize data to a Post model?"""
         tag_list = TagFactory.create_batch(randint(1, 10))
-        tag_urls = [
-            reverse("api-tag-detail", slug=tag.slug)
-            for tag in tag_list
-        ]
+        tag_urls = reverse_many("api-tag-detail", tag_list)
         startup_list = StartupFactory.create_batch(
             randint(1, 10)
         )
-        startup_urls = [
-            reverse("api-startup-detail", slug=startup.slug)
-            for startup in startup_list
-        ]
+        startup_urls = reverse_many(
+            "api-startup-detail", startup_list
+        )
         post = PostFactory(
             title="first", tags=TagFactory.create_batch(3)
         )
@@ -212,12 +193,10 @@ class PostSerializerTests(TestCase):
         self
     ):
         """Can we partially deserialize data to a Post model?"""
-        tag_urls = [
-            reverse("api-tag-detail", slug=tag.slug)
-            for tag in TagFactory.build_batch(
-                randint(1, 10)
-            )
-        ]
+        tag_urls = reverse_many(
+            "api-tag-detail",
+            TagFactory.build_batch(randint(1, 10)),
+        )
         post = PostFactory()
         s_post = PostSerializer(
             instance=post,
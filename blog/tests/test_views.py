@@ -4,6 +4,7 @@ from random import randint
 from test_plus import TestCase
 
 from config.test_utils import (
+    LazyContent,
     auth_user,
     get_instance_data,
     omit_keys,
@@ -137,7 +138,7 @@ class PostViewTests(TestCase):
             self.assertEqual(
                 Post.objects.count(),
                 post_num + 1,
-                response.content.decode("utf8"),
+                LazyContent(response),
             )
             post = Post.objects.get(slug=post_data["slug"])
             self.assertIn(tag, post.tags.all())
@@ -209,7 +210,7 @@ class PostViewTests(TestCase):
             self.assertEqual(
                 post.title,
                 "django",
-                response.content.decode("utf8"),
+                LazyContent(response),
             )
             self.assertRedirects(
                 response, post.get_absolute_url()
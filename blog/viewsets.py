@@ -15,7 +15,9 @@ class PostViewSet(ModelViewSet):
     ordering = "-pub_date"
     ordering_fields = ["pub_date"]
     pagination_class = CursorPagination
-    queryset = Post.objects.all()
+    queryset = Post.objects.prefetch_related(
+        "tags", "startups"
+    )
     required_scopes = ["post"]
     serializer_class = PostSerializer
 
@@ -0,0 +1,32 @@
+"""Fixtures shared by every test in the project"""
+from random import seed
+
+import pytest
+from django.test import override_settings
+from factory.random import reseed_random
+
+
+@pytest.fixture(scope="session", autouse=True)
+def media_root(tmp_path_factory):
+    """Save uploaded files under pytest's temporary directory
+
+    Each xdist worker has its own base directory, and pytest
+    deletes all but the most recent few runs.
+    """
+    media_dir = tmp_path_factory.mktemp("media")
+    with override_settings(MEDIA_ROOT=str(media_dir)):
+        yield media_dir
+
+
+@pytest.fixture(autouse=True)
+def seed_random():
+    """Seed random data for reproducible failures
+
+    Seeds both the random module (batch sizes, samples) and
+    the generator factory_boy shares with Faker (field
+    values). Seeding per test, not per module, keeps each
+    test's draws the same whichever xdist worker or order
+    it runs in.
+    """
+    seed(0)
+    reseed_random(0)
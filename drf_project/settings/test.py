@@ -0,0 +1,57 @@
+"""Settings for running the test suite
+
+Loaded by pytest via DJANGO_SETTINGS_MODULE in pytest.ini
+
+https://pytest-django.readthedocs.io/en/latest/configuring_django.html
+"""
+from .base import *  # noqa: F401, F403
+
+# uploaded media goes to a per-worker temporary directory:
+# see the media_root fixture in conftest.py
+
+# raise on lazy loads of related objects in loops (N+1 queries)
+# https://github.com/jmcarp/nplusone
+INSTALLED_APPS += ["nplusone.ext.django"]  # noqa: F405
+# only the middleware views depend upon: sessions and auth for
+# login, CSRF for forms, messages for the flashes tests check;
+# security headers, CORS, static files and slashes go untested
+MIDDLEWARE = [
+    "nplusone.ext.django.NPlusOneMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+]
+NPLUSONE_RAISE = True
+# only lazy loads are errors: some views prefetch relations
+# that not every template or action goes on to use
+NPLUSONE_WHITELIST = [{"label": "unused_eager_load"}]
+
+# match the DEBUG setting the test runner forces, in templates too
+DEBUG = False
+
+# parse each template once per worker, not once per render
+# https://docs.djangoproject.com/en/3.0/ref/templates/api/#django.template.loaders.cached.Loader
+TEMPLATES = [
+    {
+        **TEMPLATES[0],  # noqa: F405
+        "APP_DIRS": False,
+        "OPTIONS": {
+            **TEMPLATES[0]["OPTIONS"],  # noqa: F405
+            "debug": False,
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                )
+            ],
+        },
+    }
+]
+
+# tests create users by the hundred: skip the slow, secure hashers
+# https://docs.djangoproject.com/en/3.0/topics/testing/overview/#password-hashing
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -8,7 +8,7 @@ here instead.
 
 """
 from contextlib import contextmanager
-from functools import reduce
+from functools import lru_cache, reduce
 from operator import or_
 
 from django.contrib.auth import get_user_model
@@ -16,7 +16,9 @@ from django.contrib.auth.models import Permission
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models import Q
 from django.db.models.fields.related import ManyToManyField
+from django.dispatch import receiver
 from django.test import RequestFactory
+from django.test.signals import setting_changed
 from rest_framework.reverse import reverse as rf_reverse
 
 User = get_user_model()
@@ -31,22 +33,75 @@ def lmap(*args, **kwargs):
 def omit_keys(*args):
     """Remove keys from a dictionary"""
     *keys, dict_obj = args
+    dropped = frozenset(keys)
     return {
         field: value
         for field, value in dict_obj.items()
-        if field not in keys
+        if field not in dropped
     }
 
 
+@lru_cache(maxsize=None)
+def _cached_reverse(name, args, kwargs_items):
+    """Resolve a URL once per set of arguments
+
+    URL patterns do not change during a test run, so the
+    resolver only needs to be walked once per URL. A run
+    reverses a few thousand URLs at most: the cache is
+    unbounded to skip LRU bookkeeping on every call.
+    """
+    return rf_reverse(
+        name, args=args, kwargs=dict(kwargs_items)
+    )
+
+
+@receiver(setting_changed)
+def clear_reverse_cache(setting, **kwargs):
+    """Forget cached URLs if a test overrides the URLconf"""
+    if setting == "ROOT_URLCONF":
+        _cached_reverse.cache_clear()
+
+
 def reverse(name, *args, **kwargs):
     """Shorter Reverse function for the very lazy tester"""
     full_url = kwargs.pop("full", False)
-    uri = rf_reverse(name, args=args, kwargs=kwargs)
+    uri = _cached_reverse(
+        name, args, tuple(sorted(kwargs.items()))
+    )
     if "request" not in kwargs and full_url:
         return f"http://testserver{uri}"
     return uri
 
 
+def reverse_many(
+    name, instances, lookup_field="slug", **kwargs
+):
+    """Reverse one URL per instance in a single call
+
+    Mirrors the hyperlinks a serializer builds for a many
+    relation, so tests need not build the list by hand.
+    """
+    lookups = (
+        {lookup_field: getattr(instance, lookup_field)}
+        for instance in instances
+    )
+    return [
+        reverse(name, **kwargs, **lookup)
+        for lookup in lookups
+    ]
+
+
+@lru_cache(maxsize=None)
+def _get_request(path):
+    """Build a GET request once per path
+
+    Serializers only read from the request in their context,
+    so every test may share the same one. Unbounded like
+    _cached_reverse: a run only builds a few hundred paths.
+    """
+    return RequestFactory().get(path)
+
+
 def context_kwarg(path):
     """Build context for Serializers
 
@@ -55,42 +110,41 @@ def context_kwarg(path):
     inclusion of a request. This utility is pre-empting
     that requirement.
     """
-    return {
-        "context": {"request": RequestFactory().get(path)}
-    }
+    return {"context": {"request": _get_request(path)}}
 
 
-@contextmanager
-def auth_user(testcase):
-    """Create new user and log them in
+class ViewTestMixin:
+    """Assertions shared by tests of HTML views"""
 
-    permissions should be a string identifying a permission,
-    e.g. contenttypes.add_contenttype or contenttypes.*
-    or else a list of such strings
+    def assert_templates(self, response, *template_names):
+        """Check all templates were used in one pass
+
+        Equivalent to calling assertTemplateUsed for each
+        name, but walks response.templates only once.
+        """
+        used = {t.name for t in response.templates}
+        missing = set(template_names) - used
+        self.assertFalse(
+            missing, f"Templates not used: {missing}"
+        )
+
+
+class LazyContent:
+    """Assertion message showing the body of a response
+
+    unittest only calls str() on msg when an assertion
+    fails, so passing tests never decode the body.
     """
-    password = getattr(
-        testcase, "password", "securepassword!"
-    )
-    if (
-        not hasattr(testcase, "user_factory")
-        or testcase.user_factory is None
-    ):
-        raise ImproperlyConfigured(
-            "Testcase must specify a user factory "
-            "to use the perm_user context"
+
+    __slots__ = ("response",)
+
+    def __init__(self, response):
+        self.response = response
+
+    def __str__(self):
+        return self.response.content.decode(
+            "utf8", "replace"
         )
-    test_user = testcase.user_factory(password=password)
-    credentials = {
-        USERNAME_FIELD: getattr(test_user, USERNAME_FIELD),
-        "password": password,
-    }
-    success = testcase.client.login(**credentials)
-    testcase.assertTrue(
-        success,
-        "login failed with credentials=%r" % (credentials),
-    )
-    yield test_user
-    testcase.client.logout()
 
 
 def get_perms(string_perm):
@@ -114,40 +168,85 @@ def get_perms(string_perm):
         )
 
 
-@contextmanager
-def perm_user(testcase, permissions):
-    """Create new user with permissions and log them in
+def _get_password(testcase):
+    """Return the password test users are created with"""
+    return getattr(testcase, "password", "securepassword!")
+
+
+def create_user(testcase, permissions=None):
+    """Create new user, optionally with permissions
+
+    The user is not logged in: meant for setUpTestData,
+    so that a single user may serve every test in a class.
 
     permissions should be a string identifying a permission,
     e.g. contenttypes.add_contenttype or contenttypes.*
     or else a list of such strings
     """
-    with auth_user(testcase) as test_user:
+    if getattr(testcase, "user_factory", None) is None:
+        raise ImproperlyConfigured(
+            "Testcase must specify a user factory "
+            "to create test users"
+        )
+    test_user = testcase.user_factory(
+        password=_get_password(testcase)
+    )
+    if permissions is not None:
         if isinstance(permissions, str):
-            test_user.user_permissions.add(
-                *list(
-                    Permission.objects.filter(
-                        get_perms(permissions)
-                    )
-                )
-            )
-        else:
-            test_user.user_permissions.add(
-                *list(
-                    Permission.objects.filter(
-                        reduce(
-                            or_,
-                            (
-                                get_perms(perms)
-                                for perms in permissions
-                            ),
-                        )
-                    )
-                )
+            permissions = [permissions]
+        test_user.user_permissions.add(
+            *Permission.objects.filter(
+                reduce(or_, map(get_perms, permissions))
             )
+        )
+    return test_user
+
+
+@contextmanager
+def _password_login(testcase, test_user):
+    """Log test_user in, checking their password"""
+    credentials = {
+        USERNAME_FIELD: getattr(test_user, USERNAME_FIELD),
+        "password": _get_password(testcase),
+    }
+    success = testcase.client.login(**credentials)
+    testcase.assertTrue(
+        success,
+        "login failed with credentials=%r" % (credentials),
+    )
+    yield test_user
+    testcase.client.logout()
+
+
+@contextmanager
+def auth_user(testcase):
+    """Create new user and log them in"""
+    with _password_login(
+        testcase, create_user(testcase)
+    ) as test_user:
+        yield test_user
+
+
+@contextmanager
+def perm_user(testcase, permissions):
+    """Create new user with permissions and log them in
+
+    permissions are specified as for create_user.
+    """
+    with _password_login(
+        testcase, create_user(testcase, permissions)
+    ) as test_user:
         yield test_user
 
 
+@contextmanager
+def login_user(testcase, user):
+    """Log an existing user in, skipping password hashing"""
+    testcase.client.force_login(user)
+    yield user
+    testcase.client.logout()
+
+
 def get_concrete_field_names(Model):
     """Return all of the concrete field names for a Model
 
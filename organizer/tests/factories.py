@@ -12,7 +12,27 @@ from factory import (
 from ..models import NewsLink, Startup, Tag
 
 
-class TagFactory(DjangoModelFactory):
+class BulkModelFactory(DjangoModelFactory):
+    """Factory able to save a batch in a single INSERT"""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def create_batch_bulk(cls, size, **kwargs):
+        """Build size objects and save them with bulk_create
+
+        Skips post_generation hooks and model signals, so
+        related data must be added by the caller. Relies on
+        the backend setting primary keys on bulk INSERT, as
+        PostgreSQL (the test and production database) does.
+        """
+        return cls._meta.model.objects.bulk_create(
+            cls.build_batch(size, **kwargs)
+        )
+
+
+class TagFactory(BulkModelFactory):
     """Factory for Tags (labels)"""
 
     name = Sequence(lambda n: f"name-{n}")
@@ -22,7 +42,7 @@ class TagFactory(DjangoModelFactory):
         model = Tag
 
 
-class StartupFactory(DjangoModelFactory):
+class StartupFactory(BulkModelFactory):
     """Factory for startup company data"""
 
     name = Sequence(lambda n: f"name-{n}")
@@ -1,5 +1,4 @@
 """Tests for Organizer Views"""
-import json
 from functools import partial
 
 from test_plus import APITestCase
@@ -41,7 +40,7 @@ class TagAPITests(APITestCase):
     @property
     def response_json(self):
         """Shortcut to obtain JSON from last response"""
-        return json.loads(self.last_response.content)
+        return self.last_response.json()
 
     def test_list(self):
         """Is there a list of Tag objects"""
@@ -137,7 +136,7 @@ class StartupAPITests(APITestCase):
     @property
     def response_json(self):
         """Shortcut to obtain JSON from last response"""
-        return json.loads(self.last_response.content)
+        return self.last_response.json()
 
     def test_list(self):
         """Is there a list of Startup objects"""
@@ -324,7 +323,7 @@ class NewsLinkAPITests(APITestCase):
     @property
     def response_json(self):
         """Shortcut to obtain JSON from last response"""
-        return json.loads(self.last_response.content)
+        return self.last_response.json()
 
     def test_list(self):
         """Is there a list of NewsLink objects"""
@@ -1,11 +1,16 @@
 """Tests for Serializers in the Organizer App"""
+from urllib.parse import urlparse
+
+import pytest
 from django.test import TestCase
+from django.urls import resolve
 
 from config.test_utils import (
     context_kwarg,
     get_instance_data,
     omit_keys,
     reverse,
+    reverse_many,
 )
 
 from ..models import Startup, Tag
@@ -60,10 +65,17 @@ class TagSerializerTests(TestCase):
 class StartupSerializerTests(TestCase):
     """Test Serialization of Startups in StartupSerializer"""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Generate tags and their URLs for entire suite"""
+        cls.tag_list = TagFactory.create_batch_bulk(3)
+        cls.tag_urls = reverse_many(
+            "api-tag-detail", cls.tag_list, full=True
+        )
+
     def test_serialization(self):
         """Does an existing Startup serialize correctly?"""
-        tag_list = TagFactory.create_batch(3)
-        startup = StartupFactory(tags=tag_list)
+        startup = StartupFactory(tags=self.tag_list)
         startup_url = reverse(
             "api-startup-detail",
             slug=startup.slug,
@@ -78,14 +90,8 @@ class StartupSerializerTests(TestCase):
                 "id", "tags", get_instance_data(startup)
             ),
         )
-        tag_urls = [
-            reverse(
-                "api-tag-detail", slug=tag.slug, full=True
-            )
-            for tag in tag_list
-        ]
         self.assertCountEqual(
-            s_startup.data["tags"], tag_urls
+            s_startup.data["tags"], self.tag_urls
         )
         self.assertEqual(s_startup.data["url"], startup_url)
 
@@ -94,11 +100,11 @@ class StartupSerializerTests(TestCase):
         startup_data = get_instance_data(
             StartupFactory.build()
         )
-        tag_urls = [
-            reverse("api-tag-detail", slug=tag.slug)
-            for tag in TagFactory.build_batch(3)
-            + TagFactory.create_batch(2)
-        ]
+        tag_urls = reverse_many(
+            "api-tag-detail",
+            TagFactory.build_batch(3)
+            + TagFactory.create_batch_bulk(2),
+        )
         data = dict(startup_data, tags=tag_urls)
         s_startup = StartupSerializer(
             data=data, **context_kwarg("/api/v1/startup/")
@@ -111,9 +117,11 @@ class StartupSerializerTests(TestCase):
             0,
             "Unexpected initial condition",
         )
+        # the tags in setUpTestData exist too
+        tag_count = len(self.tag_list) + 2
         self.assertEqual(
             Tag.objects.count(),
-            2,
+            tag_count,
             "Unexpected initial condition",
         )
         startup = s_startup.save()
@@ -128,7 +136,9 @@ class StartupSerializerTests(TestCase):
             "Startup had tags associated with it",
         )
         self.assertEqual(
-            Tag.objects.count(), 2, "Serialized Tags saved"
+            Tag.objects.count(),
+            tag_count,
+            "Serialized Tags saved",
         )
 
     def test_invalid_deserialization(self):
@@ -157,16 +167,16 @@ class NewsLinkSerializerTests(TestCase):
                 "id", "startup", get_instance_data(nl)
             ),
         )
-        self.assertEqual(
-            self.client.get(s_nl.data["url"]).status_code,
-            200,
-        )
-        self.assertEqual(
-            self.client.get(
-                s_nl.data["startup"]
-            ).status_code,
-            200,
-        )
+        url_names = {
+            "url": "api-newslink-detail",
+            "startup": "api-startup-detail",
+        }
+        for field, url_name in url_names.items():
+            with self.subTest(field=field):
+                path = urlparse(s_nl.data[field]).path
+                self.assertEqual(
+                    resolve(path).url_name, url_name
+                )
 
     def test_deserialization(self):
         """Can we deserialize data to a NewsLink model?"""
@@ -191,3 +201,26 @@ class NewsLinkSerializerTests(TestCase):
             data={}, **context_kwarg("/api/v1/newslink/")
         )
         self.assertFalse(s_nl.is_valid())
+
+
+@pytest.mark.slow
+class NewsLinkSerializerHTTPTests(TestCase):
+    """Request the URLs built by NewsLinkSerializer"""
+
+    def test_serialized_urls(self):
+        """Do serialized NewsLink URLs respond?"""
+        nl = NewsLinkFactory()
+        nl_url = f"/api/v1/newslink/{nl.slug}"
+        s_nl = NewsLinkSerializer(
+            nl, **context_kwarg(nl_url)
+        )
+        self.assertEqual(
+            self.client.head(s_nl.data["url"]).status_code,
+            200,
+        )
+        self.assertEqual(
+            self.client.head(
+                s_nl.data["startup"]
+            ).status_code,
+            200,
+        )
@@ -1,14 +1,17 @@
 """Tests for (traditional/HTML) views for Organizer App"""
-from random import randint
+from uuid import uuid4
 
+import pytest
 from django.utils.text import slugify
 from test_plus import TestCase
 
 from config.test_utils import (
-    auth_user,
+    LazyContent,
+    ViewTestMixin,
+    create_user,
     get_instance_data,
+    login_user,
     omit_keys,
-    perm_user,
     reverse,
 )
 from improved_user.factories import UserFactory
@@ -22,99 +25,99 @@ from .factories import (
 )
 
 
-class TagViewTests(TestCase):
+class TagViewTests(ViewTestMixin, TestCase):
     """Tests for views that return Tags in HTML"""
 
     user_factory = UserFactory
 
-    def test_tag_list(self):
-        """Do we render lists of tags?"""
-        tag_list = TagFactory.create_batch(5)
-        self.get_check_200("tag_list")
-        self.assertInContext("tag_list")
-        self.assertCountEqual(
-            self.get_context("tag_list"), tag_list
-        )
-        self.assertTemplateUsed(
-            self.last_response, "tag/list.html"
+    @classmethod
+    def setUpTestData(cls):
+        """Generate a Tag and users for the suite"""
+        cls.tag = TagFactory()
+        cls._tag_template = omit_keys(
+            "id", get_instance_data(TagFactory.build())
         )
-        self.assertTemplateUsed(
-            self.last_response, "tag/base.html"
+        cls.plain_user = create_user(cls)
+        cls.add_user = create_user(cls, "organizer.add_tag")
+        cls.change_user = create_user(
+            cls, "organizer.change_tag"
         )
-        self.assertTemplateUsed(
-            self.last_response, "base.html"
+        cls.delete_user = create_user(
+            cls, "organizer.delete_tag"
         )
 
-    def test_tag_list_empty(self):
-        """Do we render lists of tags if no tags?"""
+    def test_tag_list(self):
+        """Do we render lists of tags?"""
+        tag_list = [
+            self.tag,
+            *TagFactory.create_batch_bulk(4),
+        ]
         self.get_check_200("tag_list")
         self.assertInContext("tag_list")
         self.assertCountEqual(
-            self.get_context("tag_list"), []
-        )
-        self.assertTemplateUsed(
-            self.last_response, "tag/list.html"
-        )
-        self.assertTemplateUsed(
-            self.last_response, "tag/base.html"
+            self.get_context("tag_list"), tag_list
         )
-        self.assertTemplateUsed(
-            self.last_response, "base.html"
+        self.assert_templates(
+            self.last_response,
+            "tag/list.html",
+            "tag/base.html",
+            "base.html",
         )
 
     def test_tag_detail(self):
         """Do we render details of a tag?"""
-        tag = TagFactory()
-        self.get_check_200("tag_detail", slug=tag.slug)
-        self.assertContext("tag", tag)
-        self.assertTemplateUsed(
-            self.last_response, "tag/detail.html"
-        )
-        self.assertTemplateUsed(
-            self.last_response, "tag/base.html"
-        )
-        self.assertTemplateUsed(
-            self.last_response, "base.html"
+        self.get_check_200("tag_detail", slug=self.tag.slug)
+        self.assertContext("tag", self.tag)
+        self.assert_templates(
+            self.last_response,
+            "tag/detail.html",
+            "tag/base.html",
+            "base.html",
         )
 
-    def test_tag_detail_404(self):
-        """Do we return 404 for missing Tags?"""
-        self.get("tag_detail", slug="nonexistent")
-        self.response_404()
-
-    def test_tag_create_get(self):
-        """Can we view a form to create Tags?"""
+    def test_tag_create_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "tag_create"
         self.get(url_name)
         self.response_302()
-        with auth_user(self):
+
+    def test_tag_create_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "tag_create"
+        with login_user(self, self.plain_user):
             self.get(url_name)
             self.response_403()
-        with perm_user(self, "organizer.add_tag"):
+
+    def test_tag_create_get_perm(self):
+        """Can we view a form to create Tags?"""
+        url_name = "tag_create"
+        with login_user(self, self.add_user):
             response = self.get_check_200(url_name)
             form = self.get_context("form")
             self.assertIsInstance(form, TagForm)
             self.assertContext("update", False)
-            self.assertTemplateUsed(
-                response, "tag/form.html"
-            )
-            self.assertTemplateUsed(
-                response, "tag/base.html"
+            self.assert_templates(
+                response,
+                "tag/form.html",
+                "tag/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_tag_create_post(self):
         """Can we submit a form to create tags?"""
-        with perm_user(self, "organizer.add_tag"):
-            self.assertEqual(Tag.objects.count(), 0)
-            tag_data = omit_keys(
-                "id", get_instance_data(TagFactory.build())
-            )
+        with login_user(self, self.add_user):
+            tag_num = Tag.objects.count()
+            tag_data = {
+                **self._tag_template,
+                "name": f"unique-{uuid4().hex[:8]}",
+            }
             response = self.post(
                 "tag_create", data=tag_data
             )
             self.assertEqual(
-                Tag.objects.count(), 1, response.content
+                Tag.objects.count(),
+                tag_num + 1,
+                LazyContent(response),
             )
             tag = Tag.objects.get(
                 slug=slugify(tag_data["name"])
@@ -123,31 +126,37 @@ class TagViewTests(TestCase):
                 response, tag.get_absolute_url()
             )
 
-    def test_tag_update_get(self):
-        """Can we view a form to update Tags?"""
-        tag = TagFactory()
+    def test_tag_update_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "tag_update"
-        self.get(url_name, slug=tag.slug)
+        self.get(url_name, slug=self.tag.slug)
         self.response_302()
-        with auth_user(self):
-            self.get(url_name, slug=tag.slug)
+
+    def test_tag_update_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "tag_update"
+        with login_user(self, self.plain_user):
+            self.get(url_name, slug=self.tag.slug)
             self.response_403()
-        with perm_user(self, "organizer.change_tag"):
+
+    def test_tag_update_get_perm(self):
+        """Can we view a form to update Tags?"""
+        url_name = "tag_update"
+        with login_user(self, self.change_user):
             response = self.get_check_200(
-                url_name, slug=tag.slug
+                url_name, slug=self.tag.slug
             )
             form = self.get_context("form")
             self.assertIsInstance(form, TagForm)
             context_tag = self.get_context("tag")
-            self.assertEqual(tag.pk, context_tag.pk)
+            self.assertEqual(self.tag.pk, context_tag.pk)
             self.assertContext("update", True)
-            self.assertTemplateUsed(
-                response, "tag/form.html"
+            self.assert_templates(
+                response,
+                "tag/form.html",
+                "tag/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(
-                response, "tag/base.html"
-            )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_tag_update_post(self):
         """Can we submit a form to update tags?"""
@@ -156,7 +165,7 @@ class TagViewTests(TestCase):
         tag_data = omit_keys(
             "id", "name", get_instance_data(tag)
         )
-        with perm_user(self, "organizer.change_tag"):
+        with login_user(self, self.change_user):
             response = self.post(
                 "tag_update",
                 slug=tag.slug,
@@ -164,39 +173,45 @@ class TagViewTests(TestCase):
             )
             tag.refresh_from_db()
             self.assertEqual(
-                tag.name, "django", response.content
+                tag.name, "django", LazyContent(response)
             )
             self.assertRedirects(
                 response, tag.get_absolute_url()
             )
 
-    def test_tag_delete_get(self):
-        """Can we view a form to delete a Tag?"""
-        tag = TagFactory()
+    def test_tag_delete_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "tag_delete"
-        self.get(url_name, slug=tag.slug)
+        self.get(url_name, slug=self.tag.slug)
         self.response_302()
-        with auth_user(self):
-            self.get(url_name, slug=tag.slug)
+
+    def test_tag_delete_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "tag_delete"
+        with login_user(self, self.plain_user):
+            self.get(url_name, slug=self.tag.slug)
             self.response_403()
-        with perm_user(self, "organizer.delete_tag"):
+
+    def test_tag_delete_get_perm(self):
+        """Can we view a form to delete a Tag?"""
+        url_name = "tag_delete"
+        with login_user(self, self.delete_user):
             response = self.get_check_200(
-                url_name, slug=tag.slug
+                url_name, slug=self.tag.slug
             )
             context_tag = self.get_context("tag")
-            self.assertEqual(tag.pk, context_tag.pk)
-            self.assertTemplateUsed(
-                response, "tag/confirm_delete.html"
-            )
-            self.assertTemplateUsed(
-                response, "tag/base.html"
+            self.assertEqual(self.tag.pk, context_tag.pk)
+            self.assert_templates(
+                response,
+                "tag/confirm_delete.html",
+                "tag/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_tag_delete_post(self):
         """Can we submit a form to delete a Tag?"""
         tag = TagFactory()
-        with perm_user(self, "organizer.delete_tag"):
+        with login_user(self, self.delete_user):
             response = self.post(
                 "tag_delete", slug=tag.slug
             )
@@ -208,108 +223,109 @@ class TagViewTests(TestCase):
             )
 
 
-class StartupViewTests(TestCase):
+class StartupViewTests(ViewTestMixin, TestCase):
     """Tests for views that return Startups in HTML"""
 
     user_factory = UserFactory
 
-    def test_startup_list(self):
-        """Do we render lists of startups?"""
-        startup_list = StartupFactory.create_batch(5)
-        self.get_check_200("startup_list")
-        self.assertInContext("startup_list")
-        self.assertCountEqual(
-            self.get_context("startup_list"), startup_list
+    @classmethod
+    def setUpTestData(cls):
+        """Generate a Startup and users for the suite"""
+        cls.startup = StartupFactory()
+        # the form requires at least one Tag
+        cls.tag = TagFactory()
+        cls._startup_template = omit_keys(
+            "id", get_instance_data(StartupFactory.build())
         )
-        self.assertTemplateUsed(
-            self.last_response, "startup/list.html"
+        cls.plain_user = create_user(cls)
+        cls.add_user = create_user(
+            cls, "organizer.add_startup"
         )
-        self.assertTemplateUsed(
-            self.last_response, "startup/base.html"
+        cls.change_user = create_user(
+            cls, "organizer.change_startup"
         )
-        self.assertTemplateUsed(
-            self.last_response, "base.html"
+        cls.delete_user = create_user(
+            cls, "organizer.delete_startup"
         )
 
-    def test_startup_list_empty(self):
-        """Do we render lists of startups if no startups?"""
+    def test_startup_list(self):
+        """Do we render lists of startups?"""
+        startup_list = [
+            self.startup,
+            *StartupFactory.create_batch_bulk(4),
+        ]
         self.get_check_200("startup_list")
         self.assertInContext("startup_list")
         self.assertCountEqual(
-            self.get_context("startup_list"), []
-        )
-        self.assertTemplateUsed(
-            self.last_response, "startup/list.html"
-        )
-        self.assertTemplateUsed(
-            self.last_response, "startup/base.html"
+            self.get_context("startup_list"), startup_list
         )
-        self.assertTemplateUsed(
-            self.last_response, "base.html"
+        self.assert_templates(
+            self.last_response,
+            "startup/list.html",
+            "startup/base.html",
+            "base.html",
         )
 
     def test_startup_detail(self):
         """Do we render details of a startup?"""
-        startup = StartupFactory()
         self.get_check_200(
-            "startup_detail", slug=startup.slug
-        )
-        self.assertContext("startup", startup)
-        self.assertTemplateUsed(
-            self.last_response, "startup/detail.html"
-        )
-        self.assertTemplateUsed(
-            self.last_response, "startup/base.html"
+            "startup_detail", slug=self.startup.slug
         )
-        self.assertTemplateUsed(
-            self.last_response, "base.html"
+        self.assertContext("startup", self.startup)
+        self.assert_templates(
+            self.last_response,
+            "startup/detail.html",
+            "startup/base.html",
+            "base.html",
         )
 
-    def test_startup_detail_404(self):
-        """Do we return 404 for missing Startups?"""
-        self.get("startup_detail", slug="nonexistent")
-        self.response_404()
-
-    def test_create_get(self):
-        """Can we view the form to create Startups?"""
+    def test_create_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "startup_create"
         self.get(url_name)
         self.response_302()
-        with auth_user(self):
+
+    def test_create_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "startup_create"
+        with login_user(self, self.plain_user):
             self.get(url_name)
             self.response_403()
-        with perm_user(self, "organizer.add_startup"):
+
+    def test_create_get_perm(self):
+        """Can we view the form to create Startups?"""
+        url_name = "startup_create"
+        with login_user(self, self.add_user):
             response = self.get_check_200(url_name)
             form = self.get_context("form")
             self.assertIsInstance(form, StartupForm)
             self.assertContext("update", False)
-            self.assertTemplateUsed(
-                response, "startup/form.html"
-            )
-            self.assertTemplateUsed(
-                response, "startup/base.html"
+            self.assert_templates(
+                response,
+                "startup/form.html",
+                "startup/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_create_post(self):
         """Can we submit a form to create Startups?"""
         startup_num = Startup.objects.count()
         tag = TagFactory()
+        unique = f"unique-{uuid4().hex[:8]}"
         startup_data = {
-            **omit_keys(
-                "id",
-                get_instance_data(StartupFactory.build()),
-            ),
+            **self._startup_template,
+            "name": unique,
+            "slug": unique,
             "tags": [tag.pk],
         }
-        with perm_user(self, "organizer.add_startup"):
+        with login_user(self, self.add_user):
             response = self.post(
                 "startup_create", data=startup_data
             )
             self.assertEqual(
                 Startup.objects.count(),
                 startup_num + 1,
-                response.content.decode("utf8"),
+                LazyContent(response),
             )
             startup = Startup.objects.get(
                 slug=startup_data["slug"]
@@ -319,42 +335,48 @@ class StartupViewTests(TestCase):
                 response, startup.get_absolute_url()
             )
 
-    def test_update_get(self):
-        """Can we view a form to update startups?"""
-        startup = StartupFactory()
+    def test_update_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "startup_update"
-        self.get(url_name, slug=startup.slug)
+        self.get(url_name, slug=self.startup.slug)
         self.response_302()
-        with auth_user(self):
-            self.get(url_name, slug=startup.slug)
+
+    def test_update_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "startup_update"
+        with login_user(self, self.plain_user):
+            self.get(url_name, slug=self.startup.slug)
             self.response_403()
-        with perm_user(self, "organizer.change_startup"):
+
+    def test_update_get_perm(self):
+        """Can we view a form to update startups?"""
+        url_name = "startup_update"
+        with login_user(self, self.change_user):
             response = self.get_check_200(
-                url_name, slug=startup.slug
+                url_name, slug=self.startup.slug
             )
             form = self.get_context("form")
             self.assertIsInstance(form, StartupForm)
             context_startup = self.get_context("startup")
-            self.assertEqual(startup.pk, context_startup.pk)
-            self.assertContext("update", True)
-            self.assertTemplateUsed(
-                response, "startup/form.html"
+            self.assertEqual(
+                self.startup.pk, context_startup.pk
             )
-            self.assertTemplateUsed(
-                response, "startup/base.html"
+            self.assertContext("update", True)
+            self.assert_templates(
+                response,
+                "startup/form.html",
+                "startup/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_update_post(self):
         """Can we submit a form to update startups?"""
-        startup = StartupFactory(
-            tags=TagFactory.create_batch(randint(1, 5))
-        )
+        startup = StartupFactory(tags=[self.tag])
         self.assertNotEqual(startup.name, "django")
         startup_data = omit_keys(
             "id", get_instance_data(startup)
         )
-        with perm_user(self, "organizer.change_startup"):
+        with login_user(self, self.change_user):
             response = self.post(
                 "startup_update",
                 slug=startup.slug,
@@ -364,39 +386,47 @@ class StartupViewTests(TestCase):
             self.assertEqual(
                 startup.name,
                 "django",
-                response.content.decode("utf8"),
+                LazyContent(response),
             )
             self.assertRedirects(
                 response, startup.get_absolute_url()
             )
 
-    def test_delete_get(self):
-        """Can we view a form to delete a Startup?"""
-        startup = StartupFactory()
+    def test_delete_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "startup_delete"
-        self.get(url_name, slug=startup.slug)
+        self.get(url_name, slug=self.startup.slug)
         self.response_302()
-        with auth_user(self):
-            self.get(url_name, slug=startup.slug)
+
+    def test_delete_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "startup_delete"
+        with login_user(self, self.plain_user):
+            self.get(url_name, slug=self.startup.slug)
             self.response_403()
-        with perm_user(self, "organizer.delete_startup"):
+
+    def test_delete_get_perm(self):
+        """Can we view a form to delete a Startup?"""
+        url_name = "startup_delete"
+        with login_user(self, self.delete_user):
             response = self.get_check_200(
-                url_name, slug=startup.slug
+                url_name, slug=self.startup.slug
             )
             context_startup = self.get_context("startup")
-            self.assertEqual(startup.pk, context_startup.pk)
-            self.assertTemplateUsed(
-                response, "startup/confirm_delete.html"
+            self.assertEqual(
+                self.startup.pk, context_startup.pk
             )
-            self.assertTemplateUsed(
-                response, "startup/base.html"
+            self.assert_templates(
+                response,
+                "startup/confirm_delete.html",
+                "startup/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_delete_post(self):
         """Can we submit a form to delete a Startup?"""
         startup = StartupFactory()
-        with perm_user(self, "organizer.delete_startup"):
+        with login_user(self, self.delete_user):
             response = self.post(
                 "startup_delete", slug=startup.slug
             )
@@ -410,36 +440,62 @@ class StartupViewTests(TestCase):
             )
 
 
-class NewsLinkViewTests(TestCase):
+class NewsLinkViewTests(ViewTestMixin, TestCase):
     """Tests for views that return NewsLinks in HTML"""
 
     user_factory = UserFactory
 
+    @classmethod
+    def setUpTestData(cls):
+        """Generate NewsLink and users for entire suite"""
+        cls.startup = StartupFactory()
+        cls.newslink = NewsLinkFactory(startup=cls.startup)
+        cls._newslink_template = omit_keys(
+            "id", get_instance_data(NewsLinkFactory.build())
+        )
+        cls.plain_user = create_user(cls)
+        cls.add_user = create_user(
+            cls, "organizer.add_newslink"
+        )
+        cls.change_user = create_user(
+            cls, "organizer.change_newslink"
+        )
+        cls.delete_user = create_user(
+            cls, "organizer.delete_newslink"
+        )
+
     def test_startup_redirect(self):
         """Does URI with both slugs redirect to Startup page?"""
-        startup = StartupFactory()
-        newslink = NewsLinkFactory(startup=startup)
         response = self.get(
             "newslink_detail",
-            startup_slug=startup.slug,
-            newslink_slug=newslink.slug,
+            startup_slug=self.startup.slug,
+            newslink_slug=self.newslink.slug,
         )
         self.assertRedirects(
-            response, startup.get_absolute_url()
+            response, self.startup.get_absolute_url()
         )
 
-    def test_create_get(self):
-        """Can we view the form to create NewsLinks?"""
-        startup = StartupFactory()
+    def test_create_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "newslink_create"
-        self.get(url_name, startup_slug=startup.slug)
+        self.get(url_name, startup_slug=self.startup.slug)
         self.response_302()
-        with auth_user(self):
-            self.get(url_name, startup_slug=startup.slug)
+
+    def test_create_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "newslink_create"
+        with login_user(self, self.plain_user):
+            self.get(
+                url_name, startup_slug=self.startup.slug
+            )
             self.response_403()
-        with perm_user(self, "organizer.add_newslink"):
+
+    def test_create_get_perm(self):
+        """Can we view the form to create NewsLinks?"""
+        url_name = "newslink_create"
+        with login_user(self, self.add_user):
             response = self.get_check_200(
-                url_name, startup_slug=startup.slug
+                url_name, startup_slug=self.startup.slug
             )
             form = self.get_context("form")
             self.assertIsInstance(form, NewsLinkForm)
@@ -450,34 +506,35 @@ class NewsLinkViewTests(TestCase):
                 "provided to the NewsLinkForm",
             )
             self.assertEqual(
-                startup.pk,
+                self.startup.pk,
                 initial_startup_pk,
-                f"Startup FK {startup.pk} not set in form, "
+                f"Startup FK {self.startup.pk} not set in form, "
                 f"found {initial_startup_pk} in form instead",
             )
             context_startup = self.get_context("startup")
-            self.assertEqual(startup.pk, context_startup.pk)
-            self.assertContext("update", False)
-            self.assertTemplateUsed(
-                response, "newslink/form.html"
+            self.assertEqual(
+                self.startup.pk, context_startup.pk
             )
-            self.assertTemplateUsed(
-                response, "newslink/base.html"
+            self.assertContext("update", False)
+            self.assert_templates(
+                response,
+                "newslink/form.html",
+                "newslink/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_create_post(self):
         """Can we submit a form to create NewsLinks?"""
         newslink_num = NewsLink.objects.count()
         startup = StartupFactory()
+        unique = f"unique-{uuid4().hex[:8]}"
         newslink_data = {
-            **omit_keys(
-                "id",
-                get_instance_data(NewsLinkFactory.build()),
-            ),
+            **self._newslink_template,
+            "title": unique,
+            "slug": unique,
             "startup": startup.pk,
         }
-        with perm_user(self, "organizer.add_newslink"):
+        with login_user(self, self.add_user):
             response = self.post(
                 "newslink_create",
                 startup_slug=startup.slug,
@@ -486,7 +543,7 @@ class NewsLinkViewTests(TestCase):
             self.assertEqual(
                 NewsLink.objects.count(),
                 newslink_num + 1,
-                response.content.decode("utf8"),
+                LazyContent(response),
             )
             newslink = NewsLink.objects.get(
                 slug=newslink_data["slug"]
@@ -503,14 +560,14 @@ class NewsLinkViewTests(TestCase):
         newslink_num = NewsLink.objects.count()
         startup1 = StartupFactory()
         startup2 = StartupFactory()
+        unique = f"unique-{uuid4().hex[:8]}"
         newslink_data = {
-            **omit_keys(
-                "id",
-                get_instance_data(NewsLinkFactory.build()),
-            ),
+            **self._newslink_template,
+            "title": unique,
+            "slug": unique,
             "startup": startup1.pk,
         }
-        with perm_user(self, "organizer.add_newslink"):
+        with login_user(self, self.add_user):
             response = self.post(
                 "newslink_create",
                 startup_slug=startup2.slug,
@@ -521,49 +578,56 @@ class NewsLinkViewTests(TestCase):
             self.assertEqual(
                 NewsLink.objects.count(),
                 newslink_num,
-                response.content.decode("utf8"),
+                LazyContent(response),
             )
 
-    def test_update_get(self):
-        """Can we view a form to update newslinks?"""
-        startup = StartupFactory()
-        newslink = NewsLinkFactory(startup=startup)
+    def test_update_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "newslink_update"
         self.get(
             url_name,
-            startup_slug=startup.slug,
-            newslink_slug=newslink.slug,
+            startup_slug=self.startup.slug,
+            newslink_slug=self.newslink.slug,
         )
         self.response_302()
-        with auth_user(self):
+
+    def test_update_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "newslink_update"
+        with login_user(self, self.plain_user):
             self.get(
                 url_name,
-                startup_slug=startup.slug,
-                newslink_slug=newslink.slug,
+                startup_slug=self.startup.slug,
+                newslink_slug=self.newslink.slug,
             )
             self.response_403()
-        with perm_user(self, "organizer.change_newslink"):
+
+    def test_update_get_perm(self):
+        """Can we view a form to update newslinks?"""
+        url_name = "newslink_update"
+        with login_user(self, self.change_user):
             response = self.get_check_200(
                 url_name,
-                startup_slug=startup.slug,
-                newslink_slug=newslink.slug,
+                startup_slug=self.startup.slug,
+                newslink_slug=self.newslink.slug,
             )
             form = self.get_context("form")
             self.assertIsInstance(form, NewsLinkForm)
             context_newslink = self.get_context("newslink")
             context_startup = self.get_context("startup")
             self.assertEqual(
-                newslink.pk, context_newslink.pk
+                self.newslink.pk, context_newslink.pk
             )
-            self.assertEqual(startup.pk, context_startup.pk)
-            self.assertContext("update", True)
-            self.assertTemplateUsed(
-                response, "newslink/form.html"
+            self.assertEqual(
+                self.startup.pk, context_startup.pk
             )
-            self.assertTemplateUsed(
-                response, "newslink/base.html"
+            self.assertContext("update", True)
+            self.assert_templates(
+                response,
+                "newslink/form.html",
+                "newslink/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_update_post(self):
         """Can we submit a form to update newslinks?"""
@@ -573,7 +637,7 @@ class NewsLinkViewTests(TestCase):
         newslink_data = omit_keys(
             "id", get_instance_data(newslink)
         )
-        with perm_user(self, "organizer.change_newslink"):
+        with login_user(self, self.change_user):
             response = self.post(
                 "newslink_update",
                 startup_slug=startup.slug,
@@ -584,7 +648,7 @@ class NewsLinkViewTests(TestCase):
             self.assertEqual(
                 newslink.title,
                 "django",
-                response.content.decode("utf8"),
+                LazyContent(response),
             )
             self.assertRedirects(
                 response, newslink.get_absolute_url()
@@ -602,7 +666,7 @@ class NewsLinkViewTests(TestCase):
             "title": new_title,
             "startup": startup2.pk,
         }
-        with perm_user(self, "organizer.change_newslink"):
+        with login_user(self, self.change_user):
             response = self.post(
                 "newslink_update",
                 startup_slug=startup1.slug,
@@ -615,52 +679,59 @@ class NewsLinkViewTests(TestCase):
             self.assertNotEqual(
                 newslink.title,
                 new_title,
-                response.content.decode("utf8"),
+                LazyContent(response),
             )
 
-    def test_delete_get(self):
-        """Can we view a form to delete a NewsLink?"""
-        startup = StartupFactory()
-        newslink = NewsLinkFactory(startup=startup)
+    def test_delete_get_anon(self):
+        """Is an anonymous user redirected to login?"""
         url_name = "newslink_delete"
         self.get(
             url_name,
-            startup_slug=startup.slug,
-            newslink_slug=newslink.slug,
+            startup_slug=self.startup.slug,
+            newslink_slug=self.newslink.slug,
         )
         self.response_302()
-        with auth_user(self):
+
+    def test_delete_get_auth(self):
+        """Are users without permission forbidden?"""
+        url_name = "newslink_delete"
+        with login_user(self, self.plain_user):
             self.get(
                 url_name,
-                startup_slug=startup.slug,
-                newslink_slug=newslink.slug,
+                startup_slug=self.startup.slug,
+                newslink_slug=self.newslink.slug,
             )
             self.response_403()
-        with perm_user(self, "organizer.delete_newslink"):
+
+    def test_delete_get_perm(self):
+        """Can we view a form to delete a NewsLink?"""
+        url_name = "newslink_delete"
+        with login_user(self, self.delete_user):
             response = self.get_check_200(
                 url_name,
-                startup_slug=startup.slug,
-                newslink_slug=newslink.slug,
+                startup_slug=self.startup.slug,
+                newslink_slug=self.newslink.slug,
             )
             context_newslink = self.get_context("newslink")
             context_startup = self.get_context("startup")
             self.assertEqual(
-                newslink.pk, context_newslink.pk
+                self.newslink.pk, context_newslink.pk
             )
-            self.assertEqual(startup.pk, context_startup.pk)
-            self.assertTemplateUsed(
-                response, "newslink/confirm_delete.html"
+            self.assertEqual(
+                self.startup.pk, context_startup.pk
             )
-            self.assertTemplateUsed(
-                response, "newslink/base.html"
+            self.assert_templates(
+                response,
+                "newslink/confirm_delete.html",
+                "newslink/base.html",
+                "base.html",
             )
-            self.assertTemplateUsed(response, "base.html")
 
     def test_delete_post(self):
         """Can we submit a form to delete a NewsLink?"""
         startup = StartupFactory()
         newslink = NewsLinkFactory(startup=startup)
-        with perm_user(self, "organizer.delete_newslink"):
+        with login_user(self, self.delete_user):
             response = self.post(
                 "newslink_delete",
                 startup_slug=startup.slug,
@@ -674,3 +745,32 @@ class NewsLinkViewTests(TestCase):
                     pk=newslink.pk
                 ).exists()
             )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, template_dir",
+    [("tag_list", "tag"), ("startup_list", "startup")],
+)
+def test_list_empty(client, url_name, template_dir):
+    """Do we render lists of Tags and Startups if empty?"""
+    response = client.get(reverse(url_name))
+    assert response.status_code == 200
+    assert list(response.context[url_name]) == []
+    assert {
+        f"{template_dir}/list.html",
+        f"{template_dir}/base.html",
+        "base.html",
+    } <= {t.name for t in response.templates}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name", ["tag_detail", "startup_detail"]
+)
+def test_detail_404(client, url_name):
+    """Do we return 404 for missing Tags and Startups?"""
+    response = client.get(
+        reverse(url_name, slug="nonexistent")
+    )
+    assert response.status_code == 404
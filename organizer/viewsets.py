@@ -31,7 +31,7 @@ class StartupViewSet(ModelViewSet):
     """A set of views for the Startup model"""
 
     lookup_field = "slug"
-    queryset = Startup.objects.all()
+    queryset = Startup.objects.prefetch_related("tags")
     required_scopes = ["startup"]
     serializer_class = StartupSerializer
 
@@ -60,7 +60,7 @@ class StartupViewSet(ModelViewSet):
 class NewsLinkViewSet(ModelViewSet):
     """A set of views for the Startup model"""
 
-    queryset = NewsLink.objects.all()
+    queryset = NewsLink.objects.select_related("startup")
     required_scopes = ["newslink"]
     serializer_class = NewsLinkSerializer
 
@@ -3,13 +3,19 @@ from django.contrib.auth import SESSION_KEY
 from django.urls import reverse
 from test_plus import TestCase
 
+from config.test_utils import ViewTestMixin, login_user
 from improved_user.factories import UserFactory
 
 
-class AuthenticationViewTests(TestCase):
+class AuthenticationViewTests(ViewTestMixin, TestCase):
     """Ensure login and logout workon via the browser"""
 
     user_factory = UserFactory
+    _LOGIN_TEMPLATES = (
+        "base.html",
+        "user/base.html",
+        "user/login.html",
+    )
 
     @classmethod
     def setUpTestData(cls):
@@ -37,16 +43,9 @@ class AuthenticationViewTests(TestCase):
             ):
                 response = self.get_check_200(get_url)
                 self.assertInContext("form")
-                templates = [
-                    "base.html",
-                    "user/base.html",
-                    "user/login.html",
-                ]
-                for t_name in templates:
-                    with self.subTest(template=t_name):
-                        self.assertTemplateUsed(
-                            response, t_name
-                        )
+                self.assert_templates(
+                    response, *self._LOGIN_TEMPLATES
+                )
                 next_field = (
                     f"<input"
                     f' type="hidden"'
@@ -113,7 +112,7 @@ class AuthenticationViewTests(TestCase):
 
     def test_logout_get(self):
         """Can users logout via GET request?"""
-        with self.login(self.user, password=self.password):
+        with login_user(self, self.user):
             response = self.get("auth:logout")
             self.assertNotIn(
                 SESSION_KEY, self.client.session